@@ -19,6 +19,8 @@ root/
 │   ├── camera_intrinsic
 │   ├── camera_extrinsic
 │   ├── voxel_volume
+│   ├── depth_scale
+│   ├── compression
 │   ├── baseline (optional, if stereo)
 │   └── README
 ├── vision_data/
@@ -65,22 +67,34 @@ import pathlib
 import pickle
 import sys
 import time
+import zlib
 from argparse import ArgumentParser
-from collections import OrderedDict
+from collections import OrderedDict, deque, namedtuple
+from multiprocessing import get_context, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
 from threading import Thread, Lock
 
 import h5py
 import numpy as np
 import yaml
 
+try:
+    import hdf5plugin  # provides the Bitshuffle/LZ4 HDF5 filter
+except ImportError:
+    hdf5plugin = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 if sys.version_info[0] >= 3:
-    from queue import Empty, Full, Queue
+    from queue import Queue
 else:
-    from Queue import Empty, Full, Queue
+    from Queue import Queue
 
 import message_filters
 from msg_synchronizer import TimeSynchronizer
-import ros_numpy
 import rospy
 from ambf_msgs.msg import RigidBodyState, CameraState # from https://github.com/WPI-AIM/ambf/tree/ambf-2.0/ambf_ros_modules
 from cv_bridge import CvBridge, CvBridgeError
@@ -101,6 +115,45 @@ drill_force_data_lock = Lock()
 drill_pose_data_lock = Lock()
 log = logging.getLogger()
 
+# kinds of the synchronized image inputs, set per input by setup_subscriber
+IMAGE_KIND, DEPTH_KIND = range(2)
+
+# depth is stored as uint16 in units of 1 / DEPTH_SCALE meters (millimeters)
+DEPTH_SCALE = 1000.0
+DEPTH_MAX = np.iinfo(np.uint16).max
+
+# calibration of the recording session, parsed once from the ADF files by load_calibration
+CalibConfig = namedtuple(
+    "CalibConfig", ["intrinsic", "extrinsic", "img_height", "img_width", "scale", "baseline", "volume_pose"]
+)
+
+# structured dtype of one depth point, built once from the first PointCloud2 message
+depth_point_dtype = None
+
+# target size in bytes of one HDF5 chunk of the continuous datasets
+HDF5_CHUNK_BYTES = 1 << 20
+
+# deflate level of the chunks compressed by the writer pool
+POOL_GZIP_LEVEL = 4
+
+# chunk buffer sets in flight: one filling, two queued for the writer thread, one being written
+BUFFER_SETS_IN_FLIGHT = 4
+
+# shared memory blocks backing the chunk buffers compressed by the writer pool, keyed by id() of the buffer
+shared_blocks = {}
+
+# numpy types of the sensor_msgs/PointField datatypes
+POINTFIELD_DTYPES = {
+    1: np.int8,
+    2: np.uint8,
+    3: np.int16,
+    4: np.uint16,
+    5: np.int32,
+    6: np.uint32,
+    7: np.float32,
+    8: np.float64,
+}
+
 def rpy_to_quat(roll, pitch, yaw):
     """
     Converts roll, pitch, and yaw (Euler angles) into a quaternion representation.
@@ -130,35 +183,110 @@ def rpy_to_quat(roll, pitch, yaw):
     return x, y, z, w
 
 
-def depth_gen(depth_msg):
+def pointcloud2_dtype(depth_msg):
+    """
+    Builds the structured numpy dtype of a single point in a ROS PointCloud2 message.
+
+    Parameters:
+    - depth_msg: The input ROS PointCloud2 message.
+
+    Returns:
+    - numpy.dtype: A structured dtype with one entry per point field, padded to `point_step` bytes.
     """
-    Generates a depth map from a ROS depth message.
+    byte_order = ">" if depth_msg.is_bigendian else "<"
+    names, formats, offsets = [], [], []
+    for field in depth_msg.fields:
+        field_type = np.dtype(POINTFIELD_DTYPES[field.datatype]).newbyteorder(byte_order)
+        names.append(field.name)
+        formats.append(field_type if field.count == 1 else (field_type, field.count))
+        offsets.append(field.offset)
+    return np.dtype({"names": names, "formats": formats, "offsets": offsets, "itemsize": depth_msg.point_step})
+
+
+# Source of the depth kernels generated by make_depth_gen, with the session constants filled in as literals.
+# Both flip the image vertically to match the AMBF convention and round, clip and store into the uint16 `out`.
+DEPTH_LOOP_SOURCE = """
+def depth_kernel(x, y, z, out):
+    for i in prange({h}):
+        for j in range({w}):
+            value = ({projection}) * {s!r} + 0.5
+            out[{last_row} - i, j] = min(max(value, 0.0), {depth_max})
+"""
+DEPTH_ARRAY_SOURCE = """
+def depth_kernel(x, y, z, out):
+    out[::-1] = np.clip(({projection}) * {s!r} + 0.5, 0.0, {depth_max})
+"""
+
+
+def warmup_depth_kernel(kernel, h, w):
+    """
+    Compiles a Numba depth kernel ahead of the first message so that it doesn't pay the JIT cost.
+
+    Numba compiles one signature per array layout and mutability, so the warmup points must look like the real ones:
+    read-only (H x W) field views with the stride of a PointCloud2 point, as np.frombuffer gives over message bytes.
+    """
+    point_dtype = np.dtype([("x", np.float32), ("y", np.float32), ("z", np.float32), ("rgb", np.float32)])
+    points = np.frombuffer(bytes(h * w * point_dtype.itemsize), dtype=point_dtype).reshape(h, w)
+    kernel(points["x"], points["y"], points["z"], np.empty((h, w), dtype=np.uint16))
+
+
+def make_depth_gen(h, w, s, z_row):
+    """
+    Generates depth_gen specialized for the recording session, once the image size and calibration are known.
 
     Parameters:
-    - depth_msg: The input ROS PointCloud2 message containing depth information.
+    - h, w (int): Height and width of the depth map.
+    - s (float): Conversion factor from simulation units to depth units.
+    - z_row (numpy.ndarray): z-row of the extrinsic rotation (T_cv_ambf), zero entries are left out of the projection.
 
     Returns:
-    - numpy.ndarray: A (H x W) array of z-values representing the depth map.
+    - function: depth_gen(depth_msg), converting a ROS PointCloud2 message to a (H x W) uint16 depth map.
 
     Notes:
-    - The depth map is scaled and reshaped for compatibility with the AMBF simulation format.
-    - The output is converted to half-precision (float16) to optimize storage.
-    """
-   # Convert PointCloud2 message to structured numpy array
-    xyz_array = ros_numpy.point_cloud2.pointcloud2_to_array(depth_msg)
-    # Extract and scale x, y, z coordinates
-    xcol = xyz_array["x"][:, None] * scale
-    ycol = xyz_array["y"][:, None] * scale
-    zcol = xyz_array["z"][:, None] * scale
-    # Combine scaled coordinates into a single array
-    scaled_depth = np.concatenate([xcol, ycol, zcol], axis=-1)
-    # Convert to half-precision (float16) to save storage
-    scaled_depth = scaled_depth.astype(np.float16)
-    # Reshape depth data to match AMBF convention, reversing height direction
-    scaled_depth = np.ascontiguousarray(scaled_depth.reshape([h, w, 3])[::-1])
-    # Project using extrinsic matrix and extract z-values (last column)
-    scaled_depth = np.einsum("ab,hwb->hwa", extrinsic[:3, :3], scaled_depth)[..., -1]
-    return scaled_depth
+    - The kernel is compiled with Numba into a parallel loop over rows when available, and compiled right away
+      so the first message doesn't pay the JIT cost. Otherwise it is a single vectorized numpy expression.
+    """
+    if njit is not None:
+        source, index = DEPTH_LOOP_SOURCE, "[i, j]"
+    else:
+        source, index = DEPTH_ARRAY_SOURCE, ""
+    projection = " + ".join("%r * %s%s" % (float(c), axis, index) for c, axis in zip(z_row, "xyz") if c != 0)
+    namespace = {"np": np, "prange": prange if njit is not None else range}
+    exec(
+        source.format(h=h, w=w, last_row=h - 1, projection=projection or "0.0", s=float(s), depth_max=DEPTH_MAX),
+        namespace,
+    )
+    kernel = namespace["depth_kernel"]
+
+    def depth_gen(depth_msg):
+        """
+        Generates a depth map from a ROS depth message.
+
+        Parameters:
+        - depth_msg: The input ROS PointCloud2 message containing depth information.
+
+        Returns:
+        - numpy.ndarray: A (H x W) array of z-values representing the depth map.
+
+        Notes:
+        - The depth map is scaled and reshaped for compatibility with the AMBF simulation format.
+        - The output is quantized to uint16 millimeters (see DEPTH_SCALE), which keeps mm precision over
+          the whole range and compresses much better than float16.
+        """
+        global depth_point_dtype
+        # The point layout is fixed for the whole session, only parse the fields again if the point size changes
+        if depth_point_dtype is None or depth_point_dtype.itemsize != depth_msg.point_step:
+            depth_point_dtype = pointcloud2_dtype(depth_msg)
+        # Zero-copy structured view over the PointCloud2 buffer
+        points = np.frombuffer(depth_msg.data, dtype=depth_point_dtype).reshape(h, w)
+        depth = np.empty((h, w), dtype=np.uint16)
+        kernel(points["x"], points["y"], points["z"], depth)
+        return depth
+
+    if njit is not None:
+        kernel = njit(parallel=True, fastmath=True)(kernel)
+        warmup_depth_kernel(kernel, h, w)
+    return depth_gen
 
 
 def image_gen(image_msg):
@@ -170,7 +298,13 @@ def image_gen(image_msg):
 
     Returns:
     - numpy.ndarray: The image in BGR format as a numpy array (OpenCV compatible), or None if conversion fails.
+
+    Notes:
+    - Unpadded bgr8 images are returned as a zero-copy read-only view of the message buffer,
+      the copy happens once when the sample is stored into its chunk buffer.
     """
+    if image_msg.encoding == "bgr8" and image_msg.step == image_msg.width * 3:
+        return np.frombuffer(image_msg.data, dtype=np.uint8).reshape(image_msg.height, image_msg.width, 3)
     try:
         cv2_img = bridge.imgmsg_to_cv2(image_msg, "bgr8")
         return cv2_img
@@ -179,12 +313,13 @@ def image_gen(image_msg):
         return None
 
 
-def pose_gen(pose_msg):
+def pose_gen(pose_msg, out=None):
     """
     Generates a numpy array representation of a pose from a ROS Pose message.
 
     Parameters:
     - pose_msg: The input ROS geometry_msgs/Pose message containing position and orientation.
+    - out (numpy.ndarray, optional): A 7-element float64 array to write the pose into, a new one is allocated if None.
 
     Returns:
     - numpy.ndarray: A 7-element numpy array containing the scaled position (x, y, z) and orientation (x, y, z, w).
@@ -199,19 +334,14 @@ def pose_gen(pose_msg):
     else:
         # For CameraState messages, position/orientation is directly in pose_msg
         pose = pose_msg
-    # Create a numpy array with the scaled position (x, y, z) and the orientation (x, y, z, w)
-    pose_np = np.array(
-        [
-            pose.position.x * scale,
-            pose.position.y * scale,
-            pose.position.z * scale,
-            pose.orientation.x,
-            pose.orientation.y,
-            pose.orientation.z,
-            pose.orientation.w,
-        ]
-    )
-    return pose_np
+    if out is None:
+        out = np.empty(7)
+    # Fill the scaled position (x, y, z) and the orientation (x, y, z, w) in place
+    position, orientation = pose.position, pose.orientation
+    out[0:3] = position.x, position.y, position.z
+    out[0:3] *= scale
+    out[3:7] = orientation.x, orientation.y, orientation.z, orientation.w
+    return out
 
 
 def load_yaml_file(file_path):
@@ -265,30 +395,40 @@ def get_volume_pose(args, s):
     return np.concatenate([volume_position, volume_orientation])
 
 
-def create_hdf5_file(args, intrinsic, extrinsic, s, volume_pose):
+def create_hdf5_file(args, config):
     """Create and initialize the HDF5 file with the appropriate metadata."""
     if not os.path.exists(args.output_dir):
         os.makedirs(args.output_dir)
 
     time_str = time.strftime("%Y%m%d_%H%M%S")
-    file = h5py.File(os.path.join(args.output_dir, f"{time_str}.hdf5"), "w")
+    # A single file holds the whole recording, latest file format so it can be switched to SWMR mode
+    file = h5py.File(os.path.join(args.output_dir, f"{time_str}.hdf5"), "w", libver="latest")
+    file.attrs["start_time"] = time_str
 
     # Create new structure: metadata_v3, vision_data, physics_data
     metadata = file.create_group("metadata_v3")
-    metadata.create_dataset("camera_intrinsic", data=intrinsic)
-    metadata.create_dataset("camera_extrinsic", data=extrinsic)
+    metadata.create_dataset("camera_intrinsic", data=config.intrinsic)
+    metadata.create_dataset("camera_extrinsic", data=config.extrinsic)
     metadata.create_dataset("README", data=(
         "All position information is in meters unless specified otherwise. \n"
         "Quaternion is a list in the order of [qx, qy, qz, qw]. \n"
         "Poses are defined to be T_world_obj. \n"
         "Depth in CV convention (corrected by extrinsic, T_cv_ambf). \n"
+        "Depth is stored as uint16, divide by depth_scale to get meters. \n"
+        "The HDF5 compression filter of the recorded data is described in compression. \n"
     ))
+    metadata.create_dataset("compression", data=compression_description())
+    depth_scale = metadata.create_dataset("depth_scale", data=DEPTH_SCALE)
+    depth_scale.attrs["units"] = "depth units per meter"
+    # updated in place every chunk, from the latest volume info message
+    hdf5_vox_vol = metadata.create_dataset("voxel_volume", data=0.0)
+    hdf5_vox_vol.attrs["units"] = "mm^3, millimeters cubed"
 
     return file, metadata
 
 
-def init_hdf5(args):
-    """Main function to initialize HDF5 file with camera, volume, and metadata."""
+def load_calibration(args, extrinsic):
+    """Parse the ADF files once and return the camera, volume and conversion parameters as a CalibConfig."""
     # Load world parameters
     world_params = load_yaml_file(args.world_adf)
     main_camera = world_params["main_camera"]
@@ -298,13 +438,21 @@ def init_hdf5(args):
     s = calculate_conversion_factor(args, world_params)
     # Get volume pose
     volume_pose = get_volume_pose(args, s)
-    # Create the HDF5 file
-    file, metadata = create_hdf5_file(args, intrinsic, extrinsic, s, volume_pose)
-    # Optionally add stereo baseline info
+    # Optionally compute stereo baseline
+    baseline = None
     if args.stereo:
         stereo_params = load_yaml_file(args.stereo_adf)
         baseline = abs(stereo_params["stereoL"]["location"]["y"] - stereo_params["stereoR"]["location"]["y"]) * s
-        metadata.create_dataset("baseline", data=baseline)
+    return CalibConfig(intrinsic, extrinsic, img_height, img_width, s, baseline, volume_pose)
+
+
+def create_new_file(args, config):
+    """Main function to create the HDF5 file with its metadata and group hierarchy from the cached calibration."""
+    # Create the HDF5 file
+    file, metadata = create_hdf5_file(args, config)
+    # Optionally add stereo baseline info
+    if config.baseline is not None:
+        metadata.create_dataset("baseline", data=config.baseline)
     # Create new hierarchical structure
     # Vision Data
     vision_data = file.create_group("vision_data")
@@ -319,7 +467,7 @@ def init_hdf5(args):
     # Create subgroups for high frequency poses under physics continuous
     physics_continuous.create_group("high_frequency_poses")
 
-    return file, img_height, img_width, s, volume_pose
+    return file
 
 
 def callback(*inputs):
@@ -330,94 +478,219 @@ def callback(*inputs):
     This function processes the input data, applies the corresponding transformation
     (such as image generation or depth processing), and stores the processed data in a queue.
 
-    :param inputs: A list of input data, where the first element contains the timestamp,
-                   and the last element contains a dictionary with data keys.
+    :param inputs: A list of input messages, the image inputs in the order of `handlers` built by setup_subscriber
+                   followed by one pose input per name in `pose_names`.
     :return: None
     """
     log.log(logging.DEBUG, "Callback function triggered")
-    # Extract keys and initialize data dictionary with timestamp
-    keys = list(inputs[-1])
-    data = dict(time=inputs[0].header.stamp.to_sec())
     # Print progress every 5th data point
     if num_data % 5 == 0:
         print("Recording data: " + "#" * (num_data // 10))
-    # Define a mapping from data keys to their respective processing functions
-    data_processing_map = {
-        "l_img": image_gen,
-        "r_img": image_gen,
-        "segm": image_gen,
-        "depth": depth_gen,
-        "pose_": pose_gen
-    }
-    # Process each input and add it to the data dictionary
-    for idx, key in enumerate(keys[1:]):  # skip the first element (time)
-        for data_key, processing_func in data_processing_map.items():
-            if key.startswith(data_key):
-                data[key] = processing_func(inputs[idx])
-    # Try to add processed data to the queue, catch the Full exception
-    try:
-        data_queue.put_nowait(data)
-    except Full:
+    # Build the sample record in the order of the container keys, starting with the timestamp
+    record = [inputs[0].header.stamp.to_sec()]
+    for msg, kind in zip(inputs, handlers):
+        if kind == IMAGE_KIND:
+            record.append(image_gen(msg))
+        else:
+            record.append(depth_gen(msg))
+    # All poses of the record are filled into the rows of a single (num_poses x 7) array
+    if pose_names:
+        poses = np.empty((len(pose_names), 7))
+        for pose, pose_msg in zip(poses, inputs[len(handlers):]):
+            pose_gen(pose_msg, out=pose)
+        record.append(poses)
+    # Add processed data to the queue unless it is full (deque.append is atomic, no lock needed)
+    if len(data_queue) < data_queue.maxlen:
+        data_queue.append(record)
+    else:
         log.log(logging.DEBUG, "Queue is full, data not added")
 
 
-def create_and_store_dataset(group, key, data, compression="gzip"):
+def hdf5_chunk_shape(sample_shape, itemsize):
     """
-    Helper function to create and store a dataset in the HDF5 group.
-    
-    :param group: HDF5 group where the dataset will be created.
+    Picks the HDF5 chunk shape of a continuous dataset so that one chunk holds about HDF5_CHUNK_BYTES.
+
+    :param sample_shape: Shape of a single sample (without the time axis).
+    :param itemsize: Size in bytes of one element.
+    :return: Chunk shape, small samples are grouped along time and large ones are split along their first axis.
+    """
+    sample_bytes = int(np.prod(sample_shape)) * itemsize
+    if sample_bytes <= HDF5_CHUNK_BYTES:
+        return (max(1, HDF5_CHUNK_BYTES // sample_bytes),) + tuple(sample_shape)
+    rows = max(1, HDF5_CHUNK_BYTES // (sample_bytes // sample_shape[0]))
+    return (1, rows) + tuple(sample_shape[1:])
+
+
+def compression_options():
+    """Returns the dataset compression arguments, Bitshuffle+LZ4 if hdf5plugin is installed and LZF otherwise."""
+    if hdf5plugin is not None:
+        return dict(hdf5plugin.Bitshuffle())
+    return dict(compression="lzf")
+
+
+def compression_description():
+    """Describes the filter of compression_options, stored in metadata_v3/compression for readers of the file."""
+    if hdf5plugin is not None:
+        description = "bitshuffle+lz4, reading requires the hdf5plugin package (import hdf5plugin before opening the file)"
+    else:
+        description = "lzf, bundled with h5py"
+    if pool is not None:
+        description += "; images and depth compressed by the writer pool use gzip level %d" % POOL_GZIP_LEVEL
+    return description
+
+
+def create_continuous_dataset(group, key, sample_shape, dtype, **compression):
+    """
+    Helper function to create an empty, resizable and chunked dataset for a continuous data stream.
+
+    :param group: HDF5 group holding the dataset.
     :param key: Key for the dataset.
-    :param data: Data to be stored in the dataset.
-    :param compression: Compression type for the dataset.
+    :param sample_shape: Shape of a single sample (without the time axis).
+    :param dtype: Data type of the samples.
+    :param compression: Compression arguments passed to create_dataset.
     """
-    if len(data) > 0:
-        print(f"key {key}")
-        group.create_dataset(key, data=np.stack(data, axis=0), compression=compression)
-        log.log(logging.INFO, (key, group[key].shape))
+    group.create_dataset(
+        key,
+        shape=(0,) + tuple(sample_shape),
+        maxshape=(None,) + tuple(sample_shape),
+        chunks=hdf5_chunk_shape(sample_shape, np.dtype(dtype).itemsize),
+        dtype=dtype,
+        **compression
+    )
+
+
+def append_to_dataset(group, key, data):
+    """
+    Helper function to append samples to a resizable dataset created by init_datasets.
+    Samples go through the dataset's compression filter. Depth included: as uint16 millimeters it compresses
+    well, so it is not written with write_direct_chunk and the filter skipped as for float16 depth. The only
+    direct chunk writes left are those of chunks already compressed by the writer pool, see append_compressed.
+
+    :param group: HDF5 group holding the dataset.
+    :param key: Key for the dataset.
+    :param data: Array of samples stacked along the first axis, or a list of samples.
+    """
+    if len(data) == 0:
+        return
+    data = np.asarray(data)
+    dset = group[key]
+    start = dset.shape[0]
+    dset.resize(start + len(data), axis=0)
+    dset[start:] = data
+    log.log(logging.INFO, (key, dset.shape))
+
+
+def compress_tiles(data, chunks, first, last, level):
+    """
+    Deflate-compresses the HDF5 chunks of samples [first, last) of a chunk buffer.
+    Chunks hold a single sample split along its rows, the last row tile is zero padded to the full chunk shape.
+
+    :return: List of ((sample index, first row), compressed chunk bytes).
+    """
+    rows = chunks[1]
+    tiles = []
+    for index in range(first, last):
+        for row in range(0, data.shape[1], rows):
+            tile = data[index, row:row + rows]
+            if len(tile) < rows:
+                tile = np.concatenate([tile, np.zeros((rows - len(tile),) + tile.shape[1:], dtype=tile.dtype)])
+            tiles.append(((index, row), zlib.compress(np.ascontiguousarray(tile), level)))
+    return tiles
+
+
+def compress_chunks(block_name, shape, dtype, chunks, first, last, level):
+    """
+    Writer pool task compressing part of a chunk buffer living in shared memory, see compress_tiles.
+    The block is only attached here, it is owned and unlinked by the recorder process.
+    """
+    block = SharedMemory(name=block_name)
+    try:
+        return compress_tiles(np.ndarray(shape, dtype=dtype, buffer=block.buf), chunks, first, last, level)
+    finally:
+        block.close()
+
+
+def submit_compression(buffer, num_samples):
+    """
+    Helper function to split the samples of a shared memory chunk buffer over the writer pool.
+
+    :return: List of pending pool results, to be passed to append_compressed.
+    """
+    block = shared_blocks[id(buffer)]
+    chunks = hdf5_chunk_shape(buffer.shape[1:], buffer.dtype.itemsize)
+    step = max(1, -(-num_samples // args.writer_procs))
+    return [
+        pool.apply_async(
+            compress_chunks,
+            (block.name, buffer.shape, buffer.dtype.str, chunks, first, min(first + step, num_samples), POOL_GZIP_LEVEL),
+        )
+        for first in range(0, num_samples, step)
+    ]
+
+
+def append_compressed(group, key, buffer, num_samples, results):
+    """
+    Helper function to append samples whose HDF5 chunks were already compressed by the writer pool.
+    The chunks are handed to HDF5 with write_direct_chunk, bypassing its filter pipeline.
+
+    :param group: HDF5 group holding the dataset.
+    :param key: Key for the dataset.
+    :param buffer: The shared memory chunk buffer the samples were compressed from.
+    :param num_samples: Number of filled samples in the chunk buffer.
+    :param results: Pending pool results from submit_compression.
+    """
+    if num_samples == 0:
+        return
+    dset = group[key]
+    start = dset.shape[0]
+    dset.resize(start + num_samples, axis=0)
+    zeros = (0,) * (buffer.ndim - 2)
+    for result in results:
+        for (index, row), data in result.get():
+            dset.id.write_direct_chunk((start + index, row) + zeros, data)
+    log.log(logging.INFO, (key, dset.shape))
 
 
 def write_voxel_data(collisions):
     """
-    Process and write voxel data to HDF5.
+    Process and append voxel data to HDF5.
     
     :param collisions: Dictionary containing voxel-related data.
     :return: None
     """
+    if not collisions:
+        return
     voxel_idx, voxel_color = [], []
 
+    # Take the data collected so far, rm_vox_callback keeps appending to fresh lists
+    with voxel_data_lock:
+        batch = dict(collisions)
+        for key in collisions:
+            collisions[key] = []
+
     try:
-        assert len(collisions["voxel_color"]) == len(collisions["voxel_removed"]) == len(collisions["voxel_time_stamp"]), \
+        assert len(batch["voxel_color"]) == len(batch["voxel_removed"]) == len(batch["voxel_time_stamp"]), \
             "Dimension mismatch in voxel data"
     except AssertionError:
-        print("Voxel data dimension mismatch:", collisions)
+        print("Voxel data dimension mismatch:", batch)
         raise
 
-    for idx in range(len(collisions["voxel_time_stamp"])):
-        num_removed = collisions["voxel_removed"][idx].shape[0]
+    voxels_group = f["physics_data/intermittent_data/voxels_removed"]
+    # Gv indices continue from the groups written in previous chunks
+    first_idx = voxels_group["voxel_time_stamp"].shape[0]
+    for idx in range(len(batch["voxel_time_stamp"])):
+        num_removed = batch["voxel_removed"][idx].shape[0]
         if num_removed > 0:
-            idx_column = np.ones((num_removed, 1)) * idx
-            voxel_idx.append(np.hstack((idx_column, collisions["voxel_removed"][idx])))
-            voxel_color.append(np.hstack((idx_column, collisions["voxel_color"][idx])))
+            idx_column = np.ones((num_removed, 1)) * (first_idx + idx)
+            voxel_idx.append(np.hstack((idx_column, batch["voxel_removed"][idx])))
+            voxel_color.append(np.hstack((idx_column, batch["voxel_color"][idx])))
 
-    # Combine the voxel data and write it to the HDF5 file
+    # Append the voxel data to the HDF5 file
     try:
-        voxel_idx = np.vstack(voxel_idx)
-        voxel_color = np.vstack(voxel_color)
-        voxel_data = {
-            "voxel_time_stamp": collisions["voxel_time_stamp"],
-            "voxel_removed": voxel_idx,
-            "voxel_color": voxel_color,
-        }
-        # Create voxels_removed group under physics_data/intermittent_data
-        voxels_group = f["physics_data/intermittent_data"].create_group("voxels_removed")
-        for key, value in voxel_data.items():
-            print(f"key {key}")
-            voxels_group.create_dataset(key, data=value, compression="gzip")
-            log.log(logging.INFO, (key, voxels_group[key].shape))
-            collisions[key] = []  # Reset to free memory
-        voxels_group.create_dataset("README", data = "voxels_removed contains a group of voxels (Gv) removed. \n"
-                                           "The voxel_time_stamp contains the time that the Gv was removed. The voxels_removed contains the voxels that comprise the Gv. \n"
-                                           "The voxel_color contains the color of voxels that comprise the Gv. \n")
+        append_to_dataset(voxels_group, "voxel_time_stamp", batch["voxel_time_stamp"])
+        if voxel_idx:
+            append_to_dataset(voxels_group, "voxel_removed", np.vstack(voxel_idx))
+            append_to_dataset(voxels_group, "voxel_color", np.vstack(voxel_color))
     except Exception as e:
         print("INFO! No voxels removed in this batch due to exception:", str(e))
 
@@ -425,28 +698,23 @@ def write_voxel_data(collisions):
 # CHANGED, NEW FUNCTION
 def write_high_frequency_pose_data(high_freq_pose_data):
     """
-    Process and write high-frequency pose data (e.g., drill, camera, anatomy) to HDF5.
+    Process and append high-frequency pose data (e.g., drill, camera, anatomy) to HDF5.
     Each object gets its own subgroup under "high_frequency_poses".
 
     Changes Made:
     - Instead of a single group for drill, we now create one subgroup per object under "high_frequency_poses".
-    - Each subgroup contains "time_stamp" and "pose" datasets.
+    - Each subgroup contains "time_stamp" and "pose" datasets, created by init_datasets and appended every chunk.
     - The pose data for each object is stored at the original, higher frequency.
     - Timestamps are aligned for each pose sample of that object.
     """
     try:
         for name, pose_dict in high_freq_pose_data.items():
-            # Create a subgroup for this object under "physics_data/continuous_data/high_frequency_poses"
-            obj_group_name = name + "_pose"
-            obj_group = f["physics_data/continuous_data/high_frequency_poses"].create_group(obj_group_name)
-
-            # Write pose and timestamps
-            obj_group.create_dataset("time_stamp", data=np.stack(pose_dict["time_stamp"], axis=0), compression="gzip")
-            obj_group.create_dataset("pose", data=np.stack(pose_dict["pose"], axis=0), compression="gzip")
+            # Subgroup for this object under "physics_data/continuous_data/high_frequency_poses"
+            obj_group = f["physics_data/continuous_data/high_frequency_poses"][name + "_pose"]
 
-            # Log info
-            log.log(logging.INFO, (obj_group_name, obj_group["time_stamp"].shape))
-            log.log(logging.INFO, (obj_group_name, obj_group["pose"].shape))
+            # Append pose and timestamps
+            append_to_dataset(obj_group, "time_stamp", pose_dict["time_stamp"])
+            append_to_dataset(obj_group, "pose", pose_dict["pose"])
 
         # Reset dictionary after writing
         high_freq_pose_data.clear()
@@ -457,127 +725,239 @@ def write_high_frequency_pose_data(high_freq_pose_data):
 
 def write_volume_pose(volume_pose, num_samples):
     """
-    Write volume pose data to the HDF5 file.
+    Append volume pose data to the HDF5 file, one row per vision sample.
     
     :param volume_pose: The volume pose data.
     :param num_samples: The number of samples to write.
     :return: None
     """
     try:
-        key = "pose_mastoidectomy_volume"
-        f["vision_data/continuous_data"].create_dataset(
-            key, data=np.stack([volume_pose] * num_samples, axis=0), compression="gzip"
+        append_to_dataset(
+            f["vision_data/continuous_data"], "pose_mastoidectomy_volume", np.tile(volume_pose, (num_samples, 1))
         )
-        log.log(logging.INFO, (key, f["vision_data/continuous_data"][key].shape))
     except Exception as e:
         print('INFO! No data recorded in this batch due to exception:', str(e))
 
 
-def write_to_hdf5():
+def init_datasets(buffers):
+    """
+    Creates all datasets of the recording from the first chunk and switches the file to SWMR mode,
+    so that the file can be read while recording. No object can be added to a file in SWMR mode,
+    hence the intermittent streams get their (empty) datasets here too.
+
+    :param buffers: Chunk buffers of the vision continuous data, keyed like `container`.
+    :return: None
+    """
+    vision_continuous = f["vision_data/continuous_data"]
+    for key, value in buffers.items():
+        if value is None:
+            continue
+        if key == "pose":
+            for name in pose_names:
+                create_continuous_dataset(
+                    vision_continuous, "pose_" + name, value.shape[2:], value.dtype, **compression_options()
+                )
+        elif id(value) in shared_blocks:
+            # chunks compressed by the writer pool, see append_compressed
+            create_continuous_dataset(
+                vision_continuous, key, value.shape[1:], value.dtype, compression="gzip", compression_opts=POOL_GZIP_LEVEL
+            )
+        else:
+            create_continuous_dataset(vision_continuous, key, value.shape[1:], value.dtype, **compression_options())
+    create_continuous_dataset(vision_continuous, "pose_mastoidectomy_volume", (7,), np.float64, **compression_options())
+
+    physics_intermittent = f["physics_data/intermittent_data"]
+    if collisions:
+        voxels_group = physics_intermittent.create_group("voxels_removed")
+        create_continuous_dataset(voxels_group, "voxel_time_stamp", (), np.float64, **compression_options())
+        create_continuous_dataset(voxels_group, "voxel_removed", (4,), np.float64, **compression_options())
+        create_continuous_dataset(voxels_group, "voxel_color", (5,), np.float64, **compression_options())
+        voxels_group.create_dataset("README", data = "voxels_removed contains a group of voxels (Gv) removed. \n"
+                                           "The voxel_time_stamp contains the time that the Gv was removed. The voxels_removed contains the voxels that comprise the Gv. \n"
+                                           "The voxel_color contains the color of voxels that comprise the Gv. \n"
+                                           "The first column of voxel_removed and voxel_color is the index of the Gv in voxel_time_stamp. \n")
+    if burr_change:
+        burr_group = physics_intermittent.create_group("burr_change")
+        create_continuous_dataset(burr_group, "time_stamp", (), np.float64, **compression_options())
+        create_continuous_dataset(burr_group, "burr_size", (), np.int64, **compression_options())
+    if drill_force_feedback:
+        force_group = physics_intermittent.create_group("drill_force_feedback")
+        create_continuous_dataset(force_group, "time_stamp", (), np.float64, **compression_options())
+        create_continuous_dataset(force_group, "wrench", (6,), np.float64, **compression_options())
+
+    high_frequency_poses = f["physics_data/continuous_data/high_frequency_poses"]
+    for name in args.objects:
+        obj_group = high_frequency_poses.create_group(name + "_pose")
+        create_continuous_dataset(obj_group, "time_stamp", (), np.float64, **compression_options())
+        create_continuous_dataset(obj_group, "pose", (7,), np.float64, **compression_options())
+
+    f.swmr_mode = True
+
+
+def write_to_hdf5(buffers, num_samples):
     """
     Main function to write data to an HDF5 file. It stores voxel data, drill pose data,
     and volume pose data in their respective HDF5 datasets.
     
+    :param buffers: Chunk buffers of the vision continuous data, keyed like `container`.
+    :param num_samples: Number of filled samples in the chunk buffers.
     :return: None
     """
-    # Create and store voxel volume dataset
-    try:
-        hdf5_vox_vol = f["metadata_v3"].create_dataset("voxel_volume", data=voxel_volume)
-        hdf5_vox_vol.attrs["units"] = "mm^3, millimeters cubed"
-    except Exception:
-        f.close()
-        print("File writing interrupted.")
-        return
-    # Save vision continuous data (images and poses)
+    if not f.swmr_mode:
+        init_datasets(buffers)
+    f["metadata_v3/voxel_volume"][()] = voxel_volume
+    # Save vision continuous data (images and poses), only the filled part of the chunk buffers
     vision_continuous = f["vision_data/continuous_data"]
-    for key, value in container.items():
-        create_and_store_dataset(vision_continuous, key, value)
-        container[key] = []  # Reset to free memory
+    pending = []
+    for key, value in buffers.items():
+        if value is None:
+            continue
+        if id(value) in shared_blocks and vision_continuous[key].compression == "gzip":
+            # compressed by the writer pool while the other streams are written
+            pending.append((key, value, submit_compression(value, num_samples)))
+        elif key == "pose":
+            for idx, name in enumerate(pose_names):
+                append_to_dataset(vision_continuous, "pose_" + name, value[:num_samples, idx])
+        else:
+            append_to_dataset(vision_continuous, key, value[:num_samples])
+    for key, value, results in pending:
+        append_compressed(vision_continuous, key, value, num_samples, results)
+    write_volume_pose(volume_pose, num_samples)
 
     # Save physics intermittent data (burr_change and drill_force_feedback)
     physics_intermittent = f["physics_data/intermittent_data"]
 
-    # Create burr_change group and save data
-    if burr_change and any(len(v) > 0 for v in burr_change.values()):
-        burr_group = physics_intermittent.create_group("burr_change")
-        for key, value in burr_change.items():
-            create_and_store_dataset(burr_group, key, value)
-            burr_change[key] = []  # Reset to free memory
+    # Append burr_change data
+    for key in burr_change:
+        value, burr_change[key] = burr_change[key], []  # Reset to free memory
+        append_to_dataset(physics_intermittent["burr_change"], key, value)
 
-    # Create drill_force_feedback group and save data
-    if drill_force_feedback and any(len(v) > 0 for v in drill_force_feedback.values()):
-        drill_force_data_lock.acquire()
-        force_group = physics_intermittent.create_group("drill_force_feedback")
+    # Append drill_force_feedback data
+    with drill_force_data_lock:
         for key, value in drill_force_feedback.items():
-            create_and_store_dataset(force_group, key, value)
+            append_to_dataset(physics_intermittent["drill_force_feedback"], key, value)
             drill_force_feedback[key] = []  # Reset to free memory
-        drill_force_data_lock.release()
     # Save voxel data
     write_voxel_data(collisions)
-    try:
-        vision_data_keys = list(f["vision_data/continuous_data"].keys())
-        if vision_data_keys:
-            num_samples = len(f["vision_data/continuous_data"][vision_data_keys[0]])  # Number of samples in data
-        else:
-            num_samples = 0
-        write_volume_pose(volume_pose, num_samples)
-    except Exception as e:
-        print('INFO! No data recorded in this batch since EXCEPTION:', str(e))
-    
+
     # CHANGED: Store high frequency pose data
     drill_pose_data_lock.acquire()
     write_high_frequency_pose_data(high_freq_pose_data)
     drill_pose_data_lock.release()
 
-    # Close the file after all data is written
-    f.close()
-    print("Finished writing and closing HDF5 file")
+    # Make the chunk visible to SWMR readers, the file stays open for the next chunk
+    f.flush()
 
 
-def write_and_reinitialize_hdf5(f, args):
+def allocate_buffer(sample_shape, dtype):
+    """
+    Helper function to allocate a chunk buffer holding `chunk` samples.
+    When the writer pool is enabled, buffers of streams with one sample per HDF5 chunk (images and depth)
+    live in shared memory so that the pool workers can compress them without a copy.
+    Falls back to process memory when /dev/shm cannot hold all buffer sets in flight, since running out of
+    tmpfs pages shows up as a SIGBUS on first write instead of an error here.
     """
-    Helper function to write data to HDF5 and reinitialize the file.
-    This function is called when the chunk size is reached or when the recording is done.
+    shape = (chunk,) + tuple(sample_shape)
+    dtype = np.dtype(dtype)
+    if pool is None or len(sample_shape) < 2 or hdf5_chunk_shape(sample_shape, dtype.itemsize)[0] != 1:
+        return np.empty(shape, dtype=dtype)
+    size = int(np.prod(shape)) * dtype.itemsize
+    shm = os.statvfs("/dev/shm")
+    if shm.f_bavail * shm.f_frsize < size * BUFFER_SETS_IN_FLIGHT:
+        logging.warning("Not enough space in /dev/shm for the writer pool, compressing in the writer thread")
+        return np.empty(shape, dtype=dtype)
+    block = SharedMemory(create=True, size=size)
+    buffer = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    shared_blocks[id(buffer)] = block
+    return buffer
+
+
+def release_buffers(buffers):
+    """Helper function to drop written chunk buffers and free the shared memory backing them."""
+    for key in buffers:
+        block = shared_blocks.pop(id(buffers[key]), None)
+        buffers[key] = None
+        if block is not None:
+            block.close()
+            block.unlink()
+
+
+def swap_buffers(container):
     """
-    log.log(logging.INFO, "\nWrite data to disk")
-    write_to_hdf5()  # Write the data to disk
-    f, _, _, _, _ = init_hdf5(args)  # Re-initialize the HDF5 file
-    return f, 0  # Reset num_data to 0 after writing
+    Helper function to hand over the filled chunk buffers to the writer thread.
+    The container gets fresh buffers of the same shape so that recording continues while the chunk is written.
+    """
+    buffers = OrderedDict(container)
+    for key, value in container.items():
+        if value is not None:
+            container[key] = allocate_buffer(value.shape[1:], value.dtype)
+    return buffers
 
 
-def process_data(data_dict, container):
+def process_data(record, container, num_data):
     """
     Helper function to process and store data in containers.
-    This function appends the incoming data to the respective containers.
+    This function copies the incoming record, ordered like the container keys, into slot `num_data`
+    of the preallocated chunk buffers, allocating each buffer from the shape and dtype of the first sample it receives.
     """
-    for key, data in data_dict.items():
-        container[key].append(data)
+    for key, data in zip(container, record):
+        if container[key] is None:
+            data = np.asarray(data)
+            container[key] = allocate_buffer(data.shape, data.dtype)
+        container[key][num_data] = data
 
 
 def timer_callback():
     """
-    Callback function that continuously checks for new data in the queue and writes it to an HDF5 file
-    when a specified chunk size is reached. This function is designed to handle data in real-time,
-    minimizing any potential performance overhead while ensuring data integrity.
+    Callback function that continuously checks for new data in the queue and hands full chunks
+    over to the writer thread. This function is designed to handle data in real-time,
+    so it never blocks on disk I/O or HDF5 compression.
     """
-    global terminate_recording, finished_recording, num_data, f
+    global terminate_recording, finished_recording, num_data
     terminate_recording = False
     finished_recording = False
+    # This loop runs at 2kHz and mostly finds the queue empty, so bind the lookups it needs once
+    pop_record = data_queue.popleft
+    sleep = time.sleep
+    chunk_size = chunk
+    buffers = list(container.values())
     while not terminate_recording:
-        log.log(logging.NOTSET, "Timer callback - Checking for data")
-        try:
-            data_dict = data_queue.get_nowait()  # Non-blocking call to get data
-            # Process and store data
-            process_data(data_dict, container)
-            num_data += 1
-            if num_data >= chunk:
-                f, num_data = write_and_reinitialize_hdf5(f, args)
-        except Empty:
-            log.log(logging.NOTSET, "Queue is empty, waiting for data")
-        # Dynamically adjust sleep time based on the load or any external factors
-        time.sleep(0.002)  # Sleep for 2ms (adjustable based on real-time needs)
+        if not data_queue:
+            sleep(0.002)  # Sleep for 2ms (adjustable based on real-time needs)
+            continue
+        record = pop_record()
+        if buffers[0] is None:
+            # First record, process_data allocates the chunk buffers from it
+            process_data(record, container, num_data)
+            buffers = list(container.values())
+        else:
+            for buffer, data in zip(buffers, record):
+                buffer[num_data] = data
+        num_data += 1
+        if num_data >= chunk_size:
+            write_queue.put((swap_buffers(container), num_data, False))
+            buffers = list(container.values())
+            num_data = 0
     # Ensure that any remaining data is written to disk after recording finishes
-    write_to_hdf5()
+    write_queue.put((container, num_data, True))
+
+
+def writer_loop():
+    """
+    Background thread appending the chunks handed over by timer_callback to the HDF5 file.
+    Each item of the write queue is (buffers, num_samples, final), the file is closed and the thread exits
+    after writing the final one.
+    """
+    global finished_recording
+    while True:
+        buffers, num_samples, final = write_queue.get()
+        log.log(logging.INFO, "\nWrite data to disk")
+        write_to_hdf5(buffers, num_samples)
+        release_buffers(buffers)
+        if final:
+            break
+    f.close()
+    print("Finished writing and closing HDF5 file")
     finished_recording = True
     log.log(logging.INFO, "Finished recording and data written to disk")
 
@@ -658,7 +1038,8 @@ def setup_subscriber(args):
         if args.stereoL_topic in active_topics:
             stereoL_sub = message_filters.Subscriber(args.stereoL_topic, Image)
             subscribers += [stereoL_sub]
-            container["l_img"] = []
+            container["l_img"] = None
+            handlers.append(IMAGE_KIND)
             topics += [args.stereoL_topic]
         else:
             log.log(logging.CRITICAL, "CRITICAL! Failed to subscribe to " + args.stereoL_topic)
@@ -668,7 +1049,8 @@ def setup_subscriber(args):
         if args.depth_topic in active_topics:
             depth_sub = message_filters.Subscriber(args.depth_topic, PointCloud2)
             subscribers += [depth_sub]
-            container["depth"] = []
+            container["depth"] = None
+            handlers.append(DEPTH_KIND)
             topics += [args.depth_topic]
         else:
             log.log(logging.CRITICAL, "CRITICAL! Failed to subscribe to " + args.depth_topic)
@@ -678,7 +1060,8 @@ def setup_subscriber(args):
         if args.stereoR_topic in active_topics:
             stereoR_sub = message_filters.Subscriber(args.stereoR_topic, Image)
             subscribers += [stereoR_sub]
-            container["r_img"] = []
+            container["r_img"] = None
+            handlers.append(IMAGE_KIND)
             topics += [args.stereoR_topic]
         else:
             log.log(logging.CRITICAL, "CRITICAL! Failed to subscribe to " + args.stereoR_topic)
@@ -688,7 +1071,8 @@ def setup_subscriber(args):
         if args.segm_topic in active_topics:
             segm_sub = message_filters.Subscriber(args.segm_topic, Image)
             subscribers += [segm_sub]
-            container["segm"] = []
+            container["segm"] = None
+            handlers.append(IMAGE_KIND)
             topics += [args.segm_topic]
         else:
             log.log(logging.CRITICAL, "CRITICAL! Failed to subscribe to " + args.segm_topic)
@@ -741,7 +1125,7 @@ def setup_subscriber(args):
             pose_sub = message_filters.Subscriber(topic, RigidBodyState)
 
         if topic in active_topics:
-            container["pose_" + name] = []
+            pose_names.append(name)
             # Register high frequency pose callback
             pose_sub.registerCallback(lambda msg, name=name: high_freq_pose_callback(msg, name))
             subscribers += [pose_sub]
@@ -750,12 +1134,16 @@ def setup_subscriber(args):
             print("Failed to subscribe to", topic)
             exit()
 
+    if pose_names:
+        # poses of all objects, stored as pose_<name> datasets by write_to_hdf5
+        container["pose"] = None
+
     log.log(logging.INFO, "\n".join(["Subscribed to the following topics:"] + topics))
     return subscribers
 
 
 def main(args):
-    container["time"] = []
+    container["time"] = None  # chunk buffer, allocated on first sample
 
     # Setup ROS node and subscribers
     rospy.init_node("data_recorder")
@@ -775,16 +1163,19 @@ def main(args):
     # Otherwise, the time taken to compute synchronization becomes very long and no more message will be spit out.
     if args.sync is False:
         ats = message_filters.ApproximateTimeSynchronizer(subscribers, queue_size=50, slop=0.01)
-        ats.registerCallback(callback, container.keys())
+        ats.registerCallback(callback)
     else:
         ats = TimeSynchronizer(subscribers, queue_size=50)
-        ats.registerCallback(callback, container.keys())
+        ats.registerCallback(callback)
 
     # separate thread for writing to hdf5 to release memory
     # rospy.Timer(rospy.Duration(0, 500000), timer_callback)  # set to 2Khz such that we don't miss pose data
     global terminate_recording, finished_recording
     timer_thread = Thread(target=timer_callback)
     timer_thread.start()
+    # separate thread for disk I/O so that writing a chunk never stalls the timer
+    writer_thread = Thread(target=writer_loop, daemon=True)
+    writer_thread.start()
 
     print("Writing to HDF5 every chunk of %d data" % args.chunk_size)
 
@@ -794,9 +1185,11 @@ def main(args):
     while not finished_recording:
         print('Waiting for recording to finish')
         time.sleep(1.0)
+    if pool is not None:
+        pool.close()
+        pool.join()
 
     print("Terminating ", __file__)
-    # write_to_hdf5()  # save when user exits
 
 
 def verify_cv_bridge():
@@ -842,6 +1235,8 @@ if __name__ == "__main__":
 
     parser.add_argument("--sync", action="store_true")
     parser.add_argument("--chunk_size", type=int, default=500, help="Write to disk every chunk size")
+    parser.add_argument("--writer_procs", type=int, default=0, help="Processes compressing images and depth with gzip level %d in shared memory (faster to write, larger "
+                             "files than bitshuffle/lzf), 0 to compress in the writer thread" % POOL_GZIP_LEVEL)
     
     #fmt: on
 
@@ -882,13 +1277,30 @@ if __name__ == "__main__":
     drill_force_data_lock = Lock()
     drill_pose_data_lock = Lock()
 
-    f, h, w, scale, volume_pose = init_hdf5(args)
+    # forked here, before the numba warmup, ROS and the recording threads start any threads;
+    # the resource tracker is started first so that the workers share it with this process
+    if args.writer_procs > 0:
+        resource_tracker.ensure_running()
+        pool = get_context("fork").Pool(args.writer_procs)
+    else:
+        pool = None
+
+    calib = load_calibration(args, extrinsic)
+    h, w, scale, volume_pose = calib.img_height, calib.img_width, calib.scale, calib.volume_pose
+    f = create_new_file(args, calib)
+    # depth only needs the z-row of the extrinsic rotation
+    depth_gen = make_depth_gen(h, w, scale * DEPTH_SCALE, extrinsic[2, :3])
 
     # initialize queue for multi-threading
     chunk = args.chunk_size
-    data_queue = Queue(chunk * 2)
+    # single producer (synchronizer callback) / single consumer (timer) queue, bounded by maxlen
+    data_queue = deque(maxlen=chunk * 2)
+    # full chunk buffers waiting for the writer thread
+    write_queue = Queue(2)
     num_data = 0
     container = OrderedDict()
+    handlers = []
+    pose_names = []
     collisions = OrderedDict()
     burr_change = OrderedDict()
     drill_force_feedback = OrderedDict()
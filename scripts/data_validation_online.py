@@ -50,11 +50,11 @@ def depth_gen(depth_msg):
     scaled_depth = np.concatenate([xcol, ycol, zcol], axis=-1)
     # halve precision to save storage
     scaled_depth = scaled_depth.astype(np.float16)
-    # reverse height direction due to AMBF reshaping
-    scaled_depth = np.ascontiguousarray(scaled_depth.reshape([h, w, 3])[::-1])
     # convert to cv convention
     scaled_depth = np.einsum(
-        'ab,hwb->hwa', extrinsic[:3, :3], scaled_depth)[..., -1]
+        'ab,hwb->hwa', extrinsic[:3, :3], scaled_depth.reshape([h, w, 3]))[..., -1]
+    # reverse height direction due to AMBF reshaping, on the single channel only
+    scaled_depth = np.flipud(scaled_depth)
 
     return scaled_depth
 
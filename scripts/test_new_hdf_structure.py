@@ -39,7 +39,12 @@ def test_new_structure():
                 "Quaternion is a list in the order of [qx, qy, qz, qw]. \n"
                 "Poses are defined to be T_world_obj. \n"
                 "Depth in CV convention (corrected by extrinsic, T_cv_ambf). \n"
+                "Depth is stored as uint16, divide by depth_scale to get meters. \n"
+                "The HDF5 compression filter of the recorded data is described in compression. \n"
             ))
+            metadata.create_dataset("compression", data="lzf, bundled with h5py")
+            depth_scale = metadata.create_dataset("depth_scale", data=1000.0)
+            depth_scale.attrs["units"] = "depth units per meter"
             metadata.create_dataset("baseline", data=0.06)  # Optional stereo baseline
             voxel_volume = metadata.create_dataset("voxel_volume", data=0.125)
             voxel_volume.attrs["units"] = "mm^3, millimeters cubed"
@@ -47,7 +52,7 @@ def test_new_structure():
             # Add vision continuous data matching data_record.py
             vision_continuous.create_dataset("l_img", data=np.zeros((10, 480, 640, 3)))
             vision_continuous.create_dataset("r_img", data=np.zeros((10, 480, 640, 3)))
-            vision_continuous.create_dataset("depth", data=np.zeros((10, 480, 640)))
+            vision_continuous.create_dataset("depth", data=np.zeros((10, 480, 640), dtype=np.uint16))
             vision_continuous.create_dataset("segm", data=np.zeros((10, 480, 640, 3)))
             vision_continuous.create_dataset("time", data=np.arange(10, dtype=float))
             vision_continuous.create_dataset("pose_mastoidectomy_volume", data=np.zeros((10, 7)))
@@ -105,7 +110,7 @@ def test_new_structure():
                 print(f"✓ Main group '{group}' exists")
 
             # Check metadata datasets
-            metadata_datasets = ["camera_intrinsic", "camera_extrinsic", "README", "baseline", "voxel_volume"]
+            metadata_datasets = ["camera_intrinsic", "camera_extrinsic", "README", "baseline", "voxel_volume", "depth_scale", "compression"]
             for dataset in metadata_datasets:
                 assert dataset in f["metadata_v3"], f"Missing metadata dataset: {dataset}"
                 print(f"  ✓ Metadata dataset '{dataset}' exists")